@@ -1,7 +1,7 @@
 """Contains the GCN maker ui"""
 
 import logging
-from PyQt6 import uic, QtWidgets
+from PyQt6 import uic, QtWidgets, QtCore
 from celexta.initialize import SRC_DIRS, USR_DIRS
 from celexta.io_gui import select_file
 
@@ -41,9 +41,22 @@ class GcnMakerWindow(QtWidgets.QDialog):
         if fname is None:
             return
         
-        text = self.plainTextEdit_gcn.toPlainText()
-        with open(fname, 'w', encoding='utf-8') as f:
-            f.write(text)
+        # QSaveFile only replaces the target once the whole text has been
+        # written, so a failed save never leaves a truncated template
+        save_file = QtCore.QSaveFile(fname)
+        if not save_file.open(QtCore.QIODeviceBase.OpenModeFlag.WriteOnly):
+            log.error(f"Could not open '{fname}' for writing: {save_file.errorString()}")
+            return
+        stream = QtCore.QTextStream(save_file)
+        stream.setEncoding(QtCore.QStringConverter.Encoding.Utf8)
+        stream << self.plainTextEdit_gcn.toPlainText()
+        stream.flush()
+        if stream.status() != QtCore.QTextStream.Status.Ok:
+            log.error(f"Failed to write GCN template to '{fname}': {save_file.errorString()}")
+            save_file.cancelWriting()
+            return
+        if not save_file.commit():
+            log.error(f"Could not save GCN template to '{fname}': {save_file.errorString()}")
         
         
     def create_dir(self):
@@ -43,11 +43,20 @@ extensions = [
     "sphinx.ext.graphviz",
 ]
 
+# Highlighting a copy of every source file is the slowest part of the build,
+# skip it when only a quick check of the docs is needed
+if os.environ.get("FAST_DOCS"):
+    extensions.remove("sphinx.ext.viewcode")
+viewcode_enable_epub = False
+
 autosummary_generate = True
+# Don't document (and import) objects re-exported from other packages
+autosummary_imported_members = False
 
 numpydoc_show_class_members = False
 numpydoc_xref_param_type = True
 numpydoc_xref_ignore = {"optional", "type_without_description", "BadException"}
+numpydoc_class_members_toctree = False
 
 # -- Options for autodoc ----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html#configuration
@@ -59,18 +68,35 @@ autodoc_typehints = "description"
 # Don't show class signature with the class' name.
 autodoc_class_signature = "separated"
 
+# The GUI toolkits are not needed to render the API docs, mock them so the
+# docs build neither needs them installed nor pays for importing them.
+autodoc_mock_imports = ["PyQt6", "pyqtgraph"]
+
 # Templates
 templates_path = ['_templates']
 exclude_patterns = []
 
 # Intersphinx mappings
+# Inventories downloaded with ``make inventories`` are read from ``_inv/``,
+# the network is only used for those that are missing (or unreadable)
+INV_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_inv")
+
+
+def local_inventory(name):
+    """Return the intersphinx inventory location for project ``name``."""
+    fname = os.path.join(INV_DIR, f"{name}.inv")
+    if os.path.exists(fname):
+        return (fname, None)
+    return None
+
+
 intersphinx_mapping = {}
-intersphinx_mapping["python"] = ("https://docs.python.org/3", None)
-intersphinx_mapping["numpy"] = ("https://numpy.org/doc/stable/", None)
-intersphinx_mapping["astropy"] = ("https://docs.astropy.org/en/latest/", None)
-intersphinx_mapping["pandas"] = ("https://pandas.pydata.org/pandas-docs/stable/", None)
-intersphinx_mapping["matplotlib"] = ("https://matplotlib.org/stable/", None)
-intersphinx_mapping["scipy"] = ("https://docs.scipy.org/doc/scipy/", None)
+intersphinx_mapping["python"] = ("https://docs.python.org/3", local_inventory("python"))
+intersphinx_mapping["numpy"] = ("https://numpy.org/doc/stable/", local_inventory("numpy"))
+intersphinx_mapping["astropy"] = ("https://docs.astropy.org/en/latest/", local_inventory("astropy"))
+intersphinx_mapping["pandas"] = ("https://pandas.pydata.org/pandas-docs/stable/", local_inventory("pandas"))
+intersphinx_mapping["matplotlib"] = ("https://matplotlib.org/stable/", local_inventory("matplotlib"))
+intersphinx_mapping["scipy"] = ("https://docs.scipy.org/doc/scipy/", local_inventory("scipy"))
 
 # Inheritance diagram configuration
 inheritance_graph_attrs = dict(rankdir="LR", size='""', fontsize=14, ratio="compress")